@@ -37,7 +37,7 @@ def load_spec(path):
     with open(path) as f:
         return json.load(f)
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="GoalGen - Code generator for multi-agent conversational AI systems",
         epilog="For more information: https://github.com/yourorg/goalgen"
@@ -54,7 +54,7 @@ def main():
     parser.add_argument("--skip-validation", action="store_true",
                        help="Skip spec validation (not recommended)")
     parser.add_argument("--version", action="version", version=f"GoalGen {__version__}")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     spec = load_spec(args.spec)
 
@@ -7,12 +7,24 @@ Validates goal spec JSON files for correctness, completeness, and best practices
 
 import json
 import re
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Dict, Iterable, List, Any, Tuple, Optional
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
 
 
+# Rule tables and patterns shared by every validation run
+_REQUIRED_FIELDS = ("id", "title", "version", "agents")
+_VALID_AGENT_KINDS = ("supervisor", "llm_agent", "evaluator")
+_VALID_MODELS = ("gpt-4", "gpt-4-turbo", "gpt-4o", "gpt-4o-mini", "gpt-3.5-turbo")
+_VALID_TOOL_TYPES = ("http", "sql", "vectordb", "function", "internal")
+_VALID_HTTP_METHODS = ("GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS")
+_VALID_CHECKPOINT_BACKENDS = ("cosmos", "redis", "memory")
+_UX_TYPES = ("teams", "webchat", "api")
+_IDENTIFIER_RE = re.compile(r'^[a-z][a-z0-9_]*$')
+_SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+(-[a-zA-Z0-9.]+)?$')
+
+
 class Severity(Enum):
     """Validation issue severity levels"""
     ERROR = "error"      # Spec is invalid, generation will fail
@@ -36,11 +48,13 @@ class ValidationIssue:
 
 
 class SpecValidator:
-    """Validates goal specification files"""
+    """
+    Validates goal specification files
 
-    def __init__(self):
-        self.issues: List[ValidationIssue] = []
-        self.spec: Dict[str, Any] = {}
+    The validator itself is stateless: each validate() call checks the spec
+    in its own _ValidationRun, so one instance can be shared freely,
+    including across threads.
+    """
 
     def validate(self, spec: Dict[str, Any]) -> Tuple[bool, List[ValidationIssue]]:
         """
@@ -50,10 +64,35 @@ class SpecValidator:
             Tuple of (is_valid, issues_list)
             is_valid is False if any ERROR severity issues found
         """
+        issues = _ValidationRun(spec).run()
+
+        # Check if spec is valid (no errors)
+        has_errors = any(issue.severity == Severity.ERROR for issue in issues)
+        is_valid = not has_errors
+
+        return is_valid, issues
+
+    def validate_many(
+        self, specs: Iterable[Dict[str, Any]]
+    ) -> List[Tuple[bool, List[ValidationIssue]]]:
+        """
+        Validate several goal specs in one call
+
+        Returns:
+            One (is_valid, issues_list) tuple per spec, in input order
+        """
+        return [self.validate(spec) for spec in specs]
+
+
+class _ValidationRun:
+    """The checks behind SpecValidator.validate, with per-call state"""
+
+    def __init__(self, spec: Dict[str, Any]):
         self.spec = spec
-        self.issues = []
+        self.issues: List[ValidationIssue] = []
 
-        # Run all validation checks
+    def run(self) -> List[ValidationIssue]:
+        """Run all validation checks and return the issues found"""
         self._validate_required_fields()
         self._validate_id()
         self._validate_version()
@@ -67,11 +106,7 @@ class SpecValidator:
         self._validate_cross_references()
         self._validate_best_practices()
 
-        # Check if spec is valid (no errors)
-        has_errors = any(issue.severity == Severity.ERROR for issue in self.issues)
-        is_valid = not has_errors
-
-        return is_valid, self.issues
+        return self.issues
 
     def _add_issue(self, severity: Severity, path: str, message: str, suggestion: str = None):
         """Add a validation issue"""
@@ -81,9 +116,7 @@ class SpecValidator:
 
     def _validate_required_fields(self):
         """Validate that required top-level fields exist"""
-        required_fields = ["id", "title", "version", "agents"]
-
-        for field in required_fields:
+        for field in _REQUIRED_FIELDS:
             if field not in self.spec:
                 self._add_issue(
                     Severity.ERROR,
@@ -120,7 +153,7 @@ class SpecValidator:
             return
 
         # Must be valid Python/filename identifier
-        if not re.match(r'^[a-z][a-z0-9_]*$', spec_id):
+        if not _IDENTIFIER_RE.match(spec_id):
             self._add_issue(
                 Severity.ERROR,
                 "root.id",
@@ -154,7 +187,7 @@ class SpecValidator:
             return
 
         # Check semantic versioning format
-        if not re.match(r'^\d+\.\d+\.\d+(-[a-zA-Z0-9.]+)?$', version):
+        if not _SEMVER_RE.match(version):
             self._add_issue(
                 Severity.ERROR,
                 "root.version",
@@ -210,7 +243,7 @@ class SpecValidator:
         path = f"agents.{agent_name}"
 
         # Check agent name format
-        if not re.match(r'^[a-z][a-z0-9_]*$', agent_name):
+        if not _IDENTIFIER_RE.match(agent_name):
             self._add_issue(
                 Severity.WARNING,
                 path,
@@ -229,14 +262,12 @@ class SpecValidator:
             return
 
         kind = agent_config["kind"]
-        valid_kinds = ["supervisor", "llm_agent", "evaluator"]
-
-        if kind not in valid_kinds:
+        if kind not in _VALID_AGENT_KINDS:
             self._add_issue(
                 Severity.ERROR,
                 f"{path}.kind",
                 f"Invalid agent kind '{kind}'",
-                f"Valid kinds: {', '.join(valid_kinds)}"
+                f"Valid kinds: {', '.join(_VALID_AGENT_KINDS)}"
             )
 
         # Validate based on kind
@@ -318,14 +349,12 @@ class SpecValidator:
             )
         else:
             model = llm_config["model"]
-            valid_models = ["gpt-4", "gpt-4-turbo", "gpt-4o", "gpt-4o-mini", "gpt-3.5-turbo"]
-
-            if not any(valid in model for valid in valid_models):
+            if not any(valid in model for valid in _VALID_MODELS):
                 self._add_issue(
                     Severity.WARNING,
                     f"{path}.model",
                     f"Unknown model '{model}'. May not be supported.",
-                    f"Common models: {', '.join(valid_models)}"
+                    f"Common models: {', '.join(_VALID_MODELS)}"
                 )
 
         # Check temperature
@@ -403,14 +432,12 @@ class SpecValidator:
             return
 
         tool_type = tool_config["type"]
-        valid_types = ["http", "sql", "vectordb", "function", "internal"]
-
-        if tool_type not in valid_types:
+        if tool_type not in _VALID_TOOL_TYPES:
             self._add_issue(
                 Severity.ERROR,
                 f"{path}.type",
                 f"Invalid tool type '{tool_type}'",
-                f"Valid types: {', '.join(valid_types)}"
+                f"Valid types: {', '.join(_VALID_TOOL_TYPES)}"
             )
 
         # Validate based on type
@@ -453,13 +480,12 @@ class SpecValidator:
             )
         else:
             method = spec["method"]
-            valid_methods = ["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"]
-            if method.upper() not in valid_methods:
+            if method.upper() not in _VALID_HTTP_METHODS:
                 self._add_issue(
                     Severity.WARNING,
                     f"{path}.spec.method",
                     f"Unusual HTTP method '{method}'",
-                    f"Common methods: {', '.join(valid_methods)}"
+                    f"Common methods: {', '.join(_VALID_HTTP_METHODS)}"
                 )
 
     def _validate_sql_tool(self, tool_name: str, tool_config: Dict[str, Any]):
@@ -586,14 +612,12 @@ class SpecValidator:
 
             if "backend" in checkpoint:
                 backend = checkpoint["backend"]
-                valid_backends = ["cosmos", "redis", "memory"]
-
-                if backend not in valid_backends:
+                if backend not in _VALID_CHECKPOINT_BACKENDS:
                     self._add_issue(
                         Severity.WARNING,
                         "state_management.checkpointing.backend",
                         f"Unknown checkpointing backend '{backend}'",
-                        f"Supported: {', '.join(valid_backends)}"
+                        f"Supported: {', '.join(_VALID_CHECKPOINT_BACKENDS)}"
                     )
 
     # ===== UX Validation =====
@@ -615,7 +639,7 @@ class SpecValidator:
 
         # Check at least one UX is enabled
         has_enabled_ux = False
-        for ux_type in ["teams", "webchat", "api"]:
+        for ux_type in _UX_TYPES:
             if ux_type in ux and isinstance(ux[ux_type], dict):
                 if ux[ux_type].get("enabled", False):
                     has_enabled_ux = True
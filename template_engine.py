@@ -7,10 +7,54 @@ for generating code across all 14 generator modules.
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from pathlib import Path
+from types import MappingProxyType
 import json
 from typing import Any, Dict, List, Optional
 import re
 
+# Inputs shorter than this use the single-pass scanner instead of the regexes
+_CASE_SCAN_MAX_LEN = 64
+
+
+def _case_scan(text: str, joiner: str, separator: str) -> str:
+    """
+    Single-pass equivalent of the snake_case/kebab_case regex pipeline
+
+    Inserts `joiner` at word boundaries before ASCII capitals and collapses
+    runs of whitespace/`separator` into one `joiner`, producing exactly the
+    same output as the regex implementation.
+    """
+    out = []
+    last = len(text) - 1
+    in_run = False
+    for i, c in enumerate(text):
+        if c == separator or c.isspace():
+            if not in_run:
+                out.append(joiner)
+                in_run = True
+            continue
+        in_run = False
+        if i and 'A' <= c <= 'Z':
+            prev = text[i - 1]
+            if ('a' <= prev <= 'z' or '0' <= prev <= '9'
+                    or (prev != '\n' and i < last and 'a' <= text[i + 1] <= 'z')):
+                out.append(joiner)
+        out.append(c)
+    return ''.join(out).lower()
+
+
+# Identifiers that snake_case() would return unchanged
+_ALREADY_SNAKE = re.compile(r'[a-z0-9_]+')
+
+# Comment (prefix, suffix) per target language for the `comment` filter
+_COMMENT_SYNTAX = {
+    'python': ('# ', ''),
+    'javascript': ('// ', ''),
+    'typescript': ('// ', ''),
+    'bicep': ('// ', ''),
+    'html': ('<!-- ', ' -->'),
+}
+
 
 class TemplateEngine:
     """Template engine for code generation"""
@@ -29,19 +73,28 @@ class TemplateEngine:
             trim_blocks=True,
             lstrip_blocks=True,
             keep_trailing_newline=True,
+            # Templates don't change during a generation run, so skip the
+            # per-lookup mtime check and never evict compiled templates
+            auto_reload=False,
+            cache_size=-1,
         )
 
-        # Register custom filters
-        self.env.filters['camel_case'] = self.camel_case
-        self.env.filters['snake_case'] = self.snake_case
-        self.env.filters['pascal_case'] = self.pascal_case
-        self.env.filters['kebab_case'] = self.kebab_case
-        self.env.filters['title_case'] = self.title_case
-        self.env.filters['upper_case'] = self.upper_case
-        self.env.filters['to_json'] = self.to_json
-        self.env.filters['indent'] = self.indent_text
-        self.env.filters['quote'] = self.quote
-        self.env.filters['comment'] = self.comment
+        # Register custom filters (plain functions, looked up on the class)
+        self.env.filters.update({
+            'camel_case': TemplateEngine.camel_case,
+            'snake_case': TemplateEngine.snake_case,
+            'pascal_case': TemplateEngine.pascal_case,
+            'kebab_case': TemplateEngine.kebab_case,
+            'title_case': TemplateEngine.title_case,
+            'upper_case': TemplateEngine.upper_case,
+            'to_json': TemplateEngine.to_json,
+            'indent': TemplateEngine.indent_text,
+            'quote': TemplateEngine.quote,
+            'comment': TemplateEngine.comment,
+        })
+
+        # Output directories already created by render_to_file
+        self._made_dirs: set[Path] = set()
 
     def render(self, template_name: str, context: Dict[str, Any]) -> str:
         """
@@ -71,9 +124,16 @@ class TemplateEngine:
             context: Template context variables
             output_path: Output file path
         """
+        # Render fully before touching the file, so a template error never
+        # leaves a truncated or half-written output behind
         content = self.render(template_name, context)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content)
+
+        parent = output_path.parent
+        if parent not in self._made_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._made_dirs.add(parent)
+
+        output_path.write_text(content, encoding='utf-8')
 
     # Custom filters
 
@@ -86,6 +146,8 @@ class TemplateEngine:
     @staticmethod
     def snake_case(text: str) -> str:
         """Convert to snake_case"""
+        if len(text) < _CASE_SCAN_MAX_LEN:
+            return _case_scan(text, '_', '-')
         # Insert underscore before capitals
         s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', text)
         # Insert underscore before capital in sequence
@@ -103,6 +165,8 @@ class TemplateEngine:
     @staticmethod
     def kebab_case(text: str) -> str:
         """Convert to kebab-case"""
+        if len(text) < _CASE_SCAN_MAX_LEN:
+            return _case_scan(text, '-', '_')
         # Insert hyphen before capitals
         s1 = re.sub('(.)([A-Z][a-z]+)', r'\1-\2', text)
         s2 = re.sub('([a-z0-9])([A-Z])', r'\1-\2', s1)
@@ -118,6 +182,8 @@ class TemplateEngine:
     @staticmethod
     def upper_case(text: str) -> str:
         """Convert to UPPER_CASE"""
+        if _ALREADY_SNAKE.fullmatch(text):
+            return text.upper()
         return TemplateEngine.snake_case(text).upper()
 
     @staticmethod
@@ -140,16 +206,11 @@ class TemplateEngine:
     @staticmethod
     def comment(text: str, lang: str = 'python') -> str:
         """Add comment syntax for language"""
-        if lang == 'python':
-            return f'# {text}'
-        elif lang == 'javascript' or lang == 'typescript':
-            return f'// {text}'
-        elif lang == 'html':
-            return f'<!-- {text} -->'
-        elif lang == 'bicep':
-            return f'// {text}'
-        else:
+        syntax = _COMMENT_SYNTAX.get(lang)
+        if syntax is None:
             return text
+        prefix, suffix = syntax
+        return f'{prefix}{text}{suffix}'
 
 
 def load_spec(spec_path: Path) -> Dict[str, Any]:
@@ -177,12 +238,34 @@ def get_context_from_spec(spec: Dict[str, Any]) -> Dict[str, Any]:
         Template context dictionary with computed values
     """
     goal_id = spec['id']
+    # Only derive the fallback title when the spec doesn't provide one
+    goal_title = spec['title'] if 'title' in spec else goal_id.replace('_', ' ').title()
+    goal_description = spec.get('description', '')
+
+    # Resolve every section once; the context literal below only references locals
+    tasks = spec.get('tasks') or []
+    agents = spec.get('agents') or {}
+    tools = spec.get('tools') or {}
+    evaluators = spec.get('evaluators') or []
+    triggers = spec.get('triggers') or {}
+    context_schema = spec.get('context') or {}
+    ux = spec.get('ux') or {}
+    teams = ux.get('teams') or {}
+    webchat = ux.get('webchat') or {}
+    assets = spec.get('assets') or {}
+    topology = spec.get('topology') or {}
+    state_management = spec.get('state_management') or {}
+    api = spec.get('api') or {}
+    authentication = spec.get('authentication') or {}
+    deployment = spec.get('deployment') or {}
+    runtime_config = spec.get('runtime_config') or {}
+    environments = deployment.get('environments', ['dev', 'staging', 'prod'])
 
     context = {
         # Core identifiers
         'goal_id': goal_id,
-        'goal_title': spec.get('title', goal_id.replace('_', ' ').title()),
-        'goal_description': spec.get('description', ''),
+        'goal_title': goal_title,
+        'goal_description': goal_description,
 
         # Naming variations
         'goal_id_camel': TemplateEngine.camel_case(goal_id),
@@ -191,46 +274,46 @@ def get_context_from_spec(spec: Dict[str, Any]) -> Dict[str, Any]:
         'goal_id_upper': TemplateEngine.upper_case(goal_id),
 
         # Spec sections
-        'tasks': spec.get('tasks', []),
-        'agents': spec.get('agents', {}),
-        'tools': spec.get('tools', {}),
-        'evaluators': spec.get('evaluators', []),
-        'triggers': spec.get('triggers', {}),
-        'context_schema': spec.get('context', {}),
-        'ux': spec.get('ux', {}),
-        'assets': spec.get('assets', {}),
+        'tasks': tasks,
+        'agents': agents,
+        'tools': tools,
+        'evaluators': evaluators,
+        'triggers': triggers,
+        'context_schema': context_schema,
+        'ux': ux,
+        'assets': assets,
 
         # Architecture
-        'topology': spec.get('topology', {}),
-        'state_management': spec.get('state_management', {}),
-        'api': spec.get('api', {}),
-        'authentication': spec.get('authentication', {}),
+        'topology': topology,
+        'state_management': state_management,
+        'api': api,
+        'authentication': authentication,
 
         # Deployment
-        'deployment': spec.get('deployment', {}),
-        'runtime_config': spec.get('runtime_config', {}),
+        'deployment': deployment,
+        'runtime_config': runtime_config,
 
         # Computed values
-        'num_tasks': len(spec.get('tasks', [])),
-        'num_agents': len(spec.get('agents', {})),
-        'num_tools': len(spec.get('tools', {})),
-        'num_evaluators': len(spec.get('evaluators', [])),
+        'num_tasks': len(tasks),
+        'num_agents': len(agents),
+        'num_tools': len(tools),
+        'num_evaluators': len(evaluators),
 
         # Flags
-        'has_teams': spec.get('ux', {}).get('teams', {}).get('enabled', False),
-        'has_webchat': spec.get('ux', {}).get('webchat', {}).get('enabled', False),
-        'has_evaluators': len(spec.get('evaluators', [])) > 0,
-        'has_tools': len(spec.get('tools', {})) > 0,
+        'has_teams': teams.get('enabled', False),
+        'has_webchat': webchat.get('enabled', False),
+        'has_evaluators': len(evaluators) > 0,
+        'has_tools': len(tools) > 0,
 
         # Environment
-        'environments': spec.get('deployment', {}).get('environments', ['dev', 'staging', 'prod']),
+        'environments': environments,
     }
 
     return context
 
 
 # Template directory structure
-TEMPLATE_STRUCTURE = {
+_RAW_TEMPLATE_STRUCTURE = {
     'scaffold': [
         'README.md.j2',
         'LICENSE.j2',
@@ -332,6 +415,10 @@ TEMPLATE_STRUCTURE = {
     ],
 }
 
+# Read-only view shared by all generators
+TEMPLATE_STRUCTURE = MappingProxyType({
+    category: tuple(names) for category, names in _RAW_TEMPLATE_STRUCTURE.items()
+})
 
 if __name__ == '__main__':
     # Example usage
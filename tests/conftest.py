@@ -7,6 +7,30 @@ import tempfile
 import shutil
 from pathlib import Path
 
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional
+    ahocorasick = None
+
+
+def _scan(text, needles):
+    """
+    Return the subset of needles that occur in text
+
+    Uses a single Aho-Corasick pass when pyahocorasick is installed,
+    otherwise one substring check per needle. Overlapping needles are
+    all reported either way.
+    """
+    needles = frozenset(needles)
+    if ahocorasick is None or not needles:
+        return frozenset(n for n in needles if n in text)
+
+    automaton = ahocorasick.Automaton()
+    for needle in needles:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    return frozenset(needle for _, needle in automaton.iter(text))
+
 
 @pytest.fixture
 def temp_output_dir():
@@ -14,30 +38,35 @@ def temp_output_dir():
     temp_dir = tempfile.mkdtemp()
     yield temp_dir
     # Cleanup
-    if Path(temp_dir).exists():
-        shutil.rmtree(temp_dir)
+    shutil.rmtree(temp_dir, ignore_errors=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def scan():
+    """scan(text, needles) -> frozenset of the needles found in text"""
+    return _scan
+
+
+@pytest.fixture(scope="session")
 def goalgen_root():
     """Path to GoalGen root directory"""
     return Path(__file__).parent.parent
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def example_spec_path(goalgen_root):
     """Path to example travel planning spec"""
     return goalgen_root / "examples" / "travel_planning.json"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def example_spec(example_spec_path):
-    """Load example spec as dict"""
+    """Load example spec as dict (shared across the session; do not mutate)"""
     with open(example_spec_path) as f:
         return json.load(f)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_spec():
     """Minimal valid spec for testing"""
     return {
@@ -50,7 +79,7 @@ def minimal_spec():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def complex_spec():
     """Complex spec with multiple agents and tools"""
     return {
@@ -101,7 +130,7 @@ def complex_spec():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_spec_missing_id():
     """Invalid spec - missing id field"""
     return {
@@ -111,7 +140,7 @@ def invalid_spec_missing_id():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_spec_empty_agents():
     """Invalid spec - empty agents"""
     return {
@@ -122,7 +151,7 @@ def invalid_spec_empty_agents():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_spec_undefined_tool():
     """Invalid spec - agent references undefined tool"""
     return {
@@ -156,3 +185,8 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "requires_network: Tests that require network access"
     )
+    # Also registered by pytest-xdist; declared here so --strict-markers
+    # passes when the suite runs without it
+    config.addinivalue_line(
+        "markers", "xdist_group(name): Keep tests on one worker under --dist=loadgroup"
+    )
@@ -2,35 +2,47 @@
 Integration tests for full GoalGen generation flow
 """
 import json
+import os
 import pytest
-import tempfile
-import shutil
 import subprocess
+import sys
+import traceback
 from pathlib import Path
 
 
-class TestFullGeneration:
-    """Test complete generation workflow"""
+def run_goalgen(args):
+    """
+    Run goalgen in-process and return its exit code
 
-    def setup_method(self):
-        """Create temporary output directory"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.goalgen_root = Path(__file__).parent.parent.parent
-        self.spec_path = self.goalgen_root / "examples" / "travel_planning.json"
+    Mirrors the interpreter: SystemExit maps to its code and an uncaught
+    exception prints its traceback to stderr and returns 1.
+    """
+    from goalgen import main
 
-    def teardown_method(self):
-        """Clean up temporary directory"""
-        if Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
+    try:
+        main(args)
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+    except Exception:
+        traceback.print_exc()
+        return 1
+    return 0
 
-    def test_full_generation_completes_successfully(self):
+
+class TestFullGeneration:
+    """Test complete generation workflow"""
+
+    def test_full_generation_completes_successfully(self, goalgen_root, example_spec_path, tmp_path):
         """Test that full generation completes without errors"""
+        # End-to-end smoke test through the CLI; other tests run in-process
         result = subprocess.run(
             [
-                sys.executable if 'sys' in dir() else "python",
-                str(self.goalgen_root / "goalgen.py"),
-                "--spec", str(self.spec_path),
-                "--out", self.temp_dir
+                sys.executable,
+                str(goalgen_root / "goalgen.py"),
+                "--spec", str(example_spec_path),
+                "--out", str(tmp_path)
             ],
             capture_output=True,
             text=True
@@ -39,20 +51,14 @@ class TestFullGeneration:
         assert result.returncode == 0, f"Generation failed: {result.stderr}"
         assert "completed" in result.stdout.lower()
 
-    def test_generated_project_has_complete_structure(self):
+    def test_generated_project_has_complete_structure(self, example_spec_path, tmp_path):
         """Test that generated project has all expected directories"""
-        result = subprocess.run(
-            [
-                "python",
-                str(self.goalgen_root / "goalgen.py"),
-                "--spec", str(self.spec_path),
-                "--out", self.temp_dir
-            ],
-            capture_output=True,
-            text=True
-        )
+        returncode = run_goalgen([
+            "--spec", str(example_spec_path),
+            "--out", str(tmp_path)
+        ])
 
-        assert result.returncode == 0
+        assert returncode == 0
 
         # Check all expected directories exist
         expected_dirs = [
@@ -67,25 +73,19 @@ class TestFullGeneration:
         ]
 
         for dir_name in expected_dirs:
-            dir_path = Path(self.temp_dir, dir_name)
+            dir_path = tmp_path / dir_name
             assert dir_path.exists(), f"Expected directory {dir_name} not found"
 
-    def test_generated_project_has_manifest(self):
+    def test_generated_project_has_manifest(self, example_spec_path, tmp_path):
         """Test that manifest is created"""
-        result = subprocess.run(
-            [
-                "python",
-                str(self.goalgen_root / "goalgen.py"),
-                "--spec", str(self.spec_path),
-                "--out", self.temp_dir
-            ],
-            capture_output=True,
-            text=True
-        )
+        returncode = run_goalgen([
+            "--spec", str(example_spec_path),
+            "--out", str(tmp_path)
+        ])
 
-        assert result.returncode == 0
+        assert returncode == 0
 
-        manifest_path = Path(self.temp_dir, ".goalgen", "manifest.json")
+        manifest_path = tmp_path / ".goalgen" / "manifest.json"
         assert manifest_path.exists(), "Manifest not created"
 
         with open(manifest_path) as f:
@@ -95,108 +95,75 @@ class TestFullGeneration:
         assert "generated_files" in manifest
         assert "timestamp" in manifest
 
-    def test_selective_generation_scaffold_only(self):
+    def test_selective_generation_scaffold_only(self, example_spec_path, tmp_path):
         """Test generating only scaffold"""
-        result = subprocess.run(
-            [
-                "python",
-                str(self.goalgen_root / "goalgen.py"),
-                "--spec", str(self.spec_path),
-                "--out", self.temp_dir,
-                "--targets", "scaffold"
-            ],
-            capture_output=True,
-            text=True
-        )
+        returncode = run_goalgen([
+            "--spec", str(example_spec_path),
+            "--out", str(tmp_path),
+            "--targets", "scaffold"
+        ])
 
-        assert result.returncode == 0
+        assert returncode == 0
 
         # Scaffold should create base structure
-        assert Path(self.temp_dir, "README.md").exists()
-        assert Path(self.temp_dir, ".gitignore").exists()
+        assert (tmp_path / "README.md").exists()
+        assert (tmp_path / ".gitignore").exists()
 
-    def test_selective_generation_assets_only(self):
+    def test_selective_generation_assets_only(self, example_spec_path, tmp_path):
         """Test generating only assets"""
-        result = subprocess.run(
-            [
-                "python",
-                str(self.goalgen_root / "goalgen.py"),
-                "--spec", str(self.spec_path),
-                "--out", self.temp_dir,
-                "--targets", "assets"
-            ],
-            capture_output=True,
-            text=True
-        )
+        returncode = run_goalgen([
+            "--spec", str(example_spec_path),
+            "--out", str(tmp_path),
+            "--targets", "assets"
+        ])
 
-        assert result.returncode == 0
+        assert returncode == 0
 
         # Assets should create prompts
-        prompts_dir = Path(self.temp_dir, "prompts")
+        prompts_dir = tmp_path / "prompts"
         assert prompts_dir.exists()
         assert len(list(prompts_dir.glob("*.md"))) > 0
 
-    def test_dry_run_does_not_create_files(self):
+    def test_dry_run_does_not_create_files(self, example_spec_path, tmp_path, capsys):
         """Test that dry run doesn't create files"""
-        result = subprocess.run(
-            [
-                "python",
-                str(self.goalgen_root / "goalgen.py"),
-                "--spec", str(self.spec_path),
-                "--out", self.temp_dir,
-                "--dry-run"
-            ],
-            capture_output=True,
-            text=True
-        )
+        returncode = run_goalgen([
+            "--spec", str(example_spec_path),
+            "--out", str(tmp_path),
+            "--dry-run"
+        ])
 
-        assert result.returncode == 0
-        assert "dry run" in result.stdout.lower() or "dry-run" in result.stdout.lower()
+        assert returncode == 0
+        stdout = capsys.readouterr().out.lower()
+        assert "dry run" in stdout or "dry-run" in stdout
 
         # Should not create README (or very minimal structure)
         # Dry run behavior may vary, but manifest shouldn't be fully populated
-        if Path(self.temp_dir, ".goalgen", "manifest.json").exists():
-            with open(Path(self.temp_dir, ".goalgen", "manifest.json")) as f:
+        if (tmp_path / ".goalgen" / "manifest.json").exists():
+            with open(tmp_path / ".goalgen" / "manifest.json") as f:
                 manifest = json.load(f)
             # In dry run, generated_files should be empty or not exist
             assert manifest.get("generated_files", []) == []
 
-    def test_multiple_targets_generation(self):
+    def test_multiple_targets_generation(self, example_spec_path, tmp_path):
         """Test generating multiple specific targets"""
-        result = subprocess.run(
-            [
-                "python",
-                str(self.goalgen_root / "goalgen.py"),
-                "--spec", str(self.spec_path),
-                "--out", self.temp_dir,
-                "--targets", "scaffold,assets,agents"
-            ],
-            capture_output=True,
-            text=True
-        )
+        returncode = run_goalgen([
+            "--spec", str(example_spec_path),
+            "--out", str(tmp_path),
+            "--targets", "scaffold,assets,agents"
+        ])
 
-        assert result.returncode == 0
+        assert returncode == 0
 
         # Check that specified targets were generated
-        assert Path(self.temp_dir, "README.md").exists()  # scaffold
-        assert Path(self.temp_dir, "prompts").exists()  # assets
-        assert Path(self.temp_dir, "langgraph", "agents").exists()  # agents
+        assert (tmp_path / "README.md").exists()  # scaffold
+        assert (tmp_path / "prompts").exists()  # assets
+        assert (tmp_path / "langgraph" / "agents").exists()  # agents
 
 
 class TestGenerationWithDifferentSpecs:
     """Test generation with various spec configurations"""
 
-    def setup_method(self):
-        """Create temporary output directory"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.goalgen_root = Path(__file__).parent.parent.parent
-
-    def teardown_method(self):
-        """Clean up"""
-        if Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
-
-    def test_minimal_spec_generates_successfully(self):
+    def test_minimal_spec_generates_successfully(self, tmp_path):
         """Test generation with minimal spec"""
         minimal_spec = {
             "id": "minimal_test",
@@ -207,27 +174,21 @@ class TestGenerationWithDifferentSpecs:
             }
         }
 
-        spec_path = Path(self.temp_dir, "minimal_spec.json")
+        spec_path = tmp_path / "minimal_spec.json"
         with open(spec_path, "w") as f:
             json.dump(minimal_spec, f, indent=2)
 
-        output_dir = Path(self.temp_dir, "output")
+        output_dir = tmp_path / "output"
         output_dir.mkdir()
 
-        result = subprocess.run(
-            [
-                "python",
-                str(self.goalgen_root / "goalgen.py"),
-                "--spec", str(spec_path),
-                "--out", str(output_dir)
-            ],
-            capture_output=True,
-            text=True
-        )
+        returncode = run_goalgen([
+            "--spec", str(spec_path),
+            "--out", str(output_dir)
+        ])
 
-        assert result.returncode == 0
+        assert returncode == 0
 
-    def test_spec_with_multiple_agents_and_tools(self):
+    def test_spec_with_multiple_agents_and_tools(self, tmp_path):
         """Test generation with complex spec"""
         complex_spec = {
             "id": "complex_test",
@@ -244,46 +205,31 @@ class TestGenerationWithDifferentSpecs:
             }
         }
 
-        spec_path = Path(self.temp_dir, "complex_spec.json")
+        spec_path = tmp_path / "complex_spec.json"
         with open(spec_path, "w") as f:
             json.dump(complex_spec, f, indent=2)
 
-        output_dir = Path(self.temp_dir, "output")
+        output_dir = tmp_path / "output"
         output_dir.mkdir()
 
-        result = subprocess.run(
-            [
-                "python",
-                str(self.goalgen_root / "goalgen.py"),
-                "--spec", str(spec_path),
-                "--out", str(output_dir)
-            ],
-            capture_output=True,
-            text=True
-        )
+        returncode = run_goalgen([
+            "--spec", str(spec_path),
+            "--out", str(output_dir)
+        ])
 
-        assert result.returncode == 0
+        assert returncode == 0
 
         # Verify all agents have prompt templates
-        for agent_name in complex_spec["agents"].keys():
-            prompt_file = Path(output_dir, "prompts", f"{agent_name}.md")
-            assert prompt_file.exists(), f"Prompt for {agent_name} not created"
+        with os.scandir(output_dir / "prompts") as entries:
+            present = {entry.name for entry in entries}
+        for agent_name in complex_spec["agents"]:
+            assert f"{agent_name}.md" in present, f"Prompt for {agent_name} not created"
 
 
 class TestIncrementalGeneration:
     """Test incremental generation features"""
 
-    def setup_method(self):
-        """Setup test environment"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.goalgen_root = Path(__file__).parent.parent.parent
-
-    def teardown_method(self):
-        """Clean up"""
-        if Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
-
-    def test_incremental_flag_preserves_existing_files(self):
+    def test_incremental_flag_preserves_existing_files(self, tmp_path):
         """Test that incremental mode preserves user modifications"""
         # First generation
         spec_v1 = {
@@ -296,24 +242,18 @@ class TestIncrementalGeneration:
             }
         }
 
-        spec_path = Path(self.temp_dir, "spec.json")
+        spec_path = tmp_path / "spec.json"
         with open(spec_path, "w") as f:
             json.dump(spec_v1, f, indent=2)
 
-        output_dir = Path(self.temp_dir, "output")
+        output_dir = tmp_path / "output"
         output_dir.mkdir()
 
         # Initial generation
-        subprocess.run(
-            [
-                "python",
-                str(self.goalgen_root / "goalgen.py"),
-                "--spec", str(spec_path),
-                "--out", str(output_dir)
-            ],
-            capture_output=True,
-            text=True
-        )
+        run_goalgen([
+            "--spec", str(spec_path),
+            "--out", str(output_dir)
+        ])
 
         # Modify a generated file
         agent_file = Path(output_dir, "langgraph", "agents", "agent1.py")
@@ -338,19 +278,13 @@ class TestIncrementalGeneration:
                 json.dump(spec_v2, f, indent=2)
 
             # Incremental generation
-            result = subprocess.run(
-                [
-                    "python",
-                    str(self.goalgen_root / "goalgen.py"),
-                    "--spec", str(spec_path),
-                    "--out", str(output_dir),
-                    "--incremental"
-                ],
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode == 0:
+            returncode = run_goalgen([
+                "--spec", str(spec_path),
+                "--out", str(output_dir),
+                "--incremental"
+            ])
+
+            if returncode == 0:
                 # Check that modification is preserved
                 new_content = agent_file.read_text()
                 assert "USER MODIFICATION" in new_content, \
@@ -360,51 +294,27 @@ class TestIncrementalGeneration:
 class TestErrorHandling:
     """Test error handling in generation"""
 
-    def setup_method(self):
-        """Setup test environment"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.goalgen_root = Path(__file__).parent.parent.parent
-
-    def teardown_method(self):
-        """Clean up"""
-        if Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
-
-    def test_invalid_spec_path_fails_gracefully(self):
+    def test_invalid_spec_path_fails_gracefully(self, tmp_path, capsys):
         """Test that invalid spec path produces clear error"""
-        result = subprocess.run(
-            [
-                "python",
-                str(self.goalgen_root / "goalgen.py"),
-                "--spec", "/nonexistent/path/spec.json",
-                "--out", self.temp_dir
-            ],
-            capture_output=True,
-            text=True
-        )
+        returncode = run_goalgen([
+            "--spec", "/nonexistent/path/spec.json",
+            "--out", str(tmp_path)
+        ])
 
-        assert result.returncode != 0
-        assert "error" in result.stderr.lower() or "not found" in result.stderr.lower()
+        assert returncode != 0
+        stderr = capsys.readouterr().err.lower()
+        assert "error" in stderr or "not found" in stderr
 
-    def test_invalid_json_fails_gracefully(self):
+    def test_invalid_json_fails_gracefully(self, tmp_path, capsys):
         """Test that invalid JSON produces clear error"""
-        invalid_spec_path = Path(self.temp_dir, "invalid.json")
+        invalid_spec_path = tmp_path / "invalid.json"
         invalid_spec_path.write_text("{ invalid json }")
 
-        result = subprocess.run(
-            [
-                "python",
-                str(self.goalgen_root / "goalgen.py"),
-                "--spec", str(invalid_spec_path),
-                "--out", self.temp_dir
-            ],
-            capture_output=True,
-            text=True
-        )
-
-        assert result.returncode != 0
-        assert "json" in result.stderr.lower() or "parse" in result.stderr.lower()
+        returncode = run_goalgen([
+            "--spec", str(invalid_spec_path),
+            "--out", str(tmp_path)
+        ])
 
-
-# Add sys import at top
-import sys
+        assert returncode != 0
+        stderr = capsys.readouterr().err.lower()
+        assert "json" in stderr or "parse" in stderr
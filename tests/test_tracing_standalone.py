@@ -7,19 +7,24 @@ to avoid heavy Azure SDK dependencies during testing.
 
 import pytest
 import asyncio
-import time
 import os
 from unittest.mock import patch
 import sys
 import importlib.util
-
-# Load tracing module directly without going through frmk package
-spec = importlib.util.spec_from_file_location(
-    "tracing",
-    os.path.join(os.path.dirname(__file__), "../frmk/utils/tracing.py")
-)
-tracing = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(tracing)
+import logging
+import logging.handlers
+
+# Load tracing module directly without going through frmk package, registering
+# it in sys.modules so repeated imports (e.g. per xdist worker) reuse it
+tracing = sys.modules.get("tracing_standalone")
+if tracing is None:
+    spec = importlib.util.spec_from_file_location(
+        "tracing_standalone",
+        os.path.join(os.path.dirname(__file__), "../frmk/utils/tracing.py")
+    )
+    tracing = importlib.util.module_from_spec(spec)
+    sys.modules["tracing_standalone"] = tracing
+    spec.loader.exec_module(tracing)
 
 # Extract what we need from the module
 TraceSpan = tracing.TraceSpan
@@ -29,6 +34,47 @@ trace_span = tracing.trace_span
 TRACING_ENABLED = tracing.TRACING_ENABLED
 
 
+class FakeClock:
+    """Deterministic stand-in for the time module used by tracing"""
+
+    def __init__(self, start: float = 1_000.0):
+        self.now = start
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace tracing's clock so span durations are exact and tests never sleep"""
+    fake = FakeClock()
+    monkeypatch.setattr(tracing, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def trace_log():
+    """Collect tracing's log records in memory instead of capturing stderr"""
+    handler = logging.handlers.MemoryHandler(capacity=1024)
+    logger = tracing.logger
+    previous_level = logger.level
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    try:
+        yield handler
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(previous_level)
+
+
+def log_text(handler: logging.handlers.MemoryHandler) -> str:
+    """Join the messages buffered by a trace_log handler"""
+    return "\n".join(record.getMessage() for record in handler.buffer)
+
+
 class TestTraceSpan:
     """Test TraceSpan class for measuring execution timing"""
 
@@ -42,17 +88,16 @@ class TestTraceSpan:
         assert span.start_time > 0
         assert span.end_time is None
 
-    def test_trace_span_timing(self):
+    def test_trace_span_timing(self, clock):
         """Test TraceSpan measures execution time correctly"""
         span = TraceSpan("test.sleep", "trace-456")
 
         # Simulate some work
-        time.sleep(0.05)  # 50ms
+        clock.advance(0.05)  # 50ms
         span.end()
 
         duration = span.duration_ms  # Property, not method
-        assert duration >= 50.0  # At least 50ms
-        assert duration < 100.0  # But less than 100ms (reasonable upper bound)
+        assert duration == pytest.approx(50.0)
 
     def test_trace_span_metadata(self):
         """Test TraceSpan can store metadata"""
@@ -63,25 +108,20 @@ class TestTraceSpan:
         assert span.metadata["user_id"] == "user-123"
         assert span.metadata["action"] == "create"
 
-    def test_trace_span_log_output(self, capsys):
+    def test_trace_span_log_output(self, clock, trace_log, scan):
         """Test TraceSpan.log() outputs correct format"""
         span = TraceSpan("test.log", "trace-abc")
         span.add_metadata("component", "api")
-        time.sleep(0.01)  # 10ms
+        clock.advance(0.01)  # 10ms
         span.end()
         span.log()
 
-        captured = capsys.readouterr()
-        # Logging uses logger.info which goes to stderr in pytest
-        output = captured.err
-        assert "TRACE" in output
-        assert "test.log" in output
-        assert "trace-abc" in output
-        assert "component" in output
-        assert "api" in output
-        assert "ms" in output
+        needles = {"TRACE", "test.log", "trace-abc", "component", "api", "ms"}
+        assert scan(trace_log.buffer[-1].getMessage(), needles) == needles
 
 
+# start_trace/get_trace_id share a contextvar; keep them on one xdist worker
+@pytest.mark.xdist_group(name="trace_context")
 class TestTraceIDPropagation:
     """Test trace ID context propagation"""
 
@@ -122,40 +162,37 @@ class TestTraceSpanDecorator:
     """Test @trace_span decorator functionality"""
 
     @pytest.mark.asyncio
-    async def test_decorator_on_async_function(self, capsys):
+    async def test_decorator_on_async_function(self, clock, trace_log):
         """Test decorator works on async functions"""
 
         @trace_span("test.async_decorated")
         async def async_operation(x: int) -> int:
-            await asyncio.sleep(0.01)
+            clock.advance(0.01)
+            await asyncio.sleep(0)
             return x * 2
 
         result = await async_operation(5)
 
         assert result == 10
 
-        # Check trace output (logging goes to stderr)
-        captured = capsys.readouterr()
-        assert "test.async_decorated" in captured.err
+        assert "test.async_decorated" in trace_log.buffer[-1].getMessage()
 
-    def test_decorator_on_sync_function(self, capsys):
+    def test_decorator_on_sync_function(self, clock, trace_log):
         """Test decorator works on sync functions"""
 
         @trace_span("test.sync_decorated")
         def sync_operation(x: int) -> int:
-            time.sleep(0.01)
+            clock.advance(0.01)
             return x + 10
 
         result = sync_operation(5)
 
         assert result == 15
 
-        # Check trace output (logging goes to stderr)
-        captured = capsys.readouterr()
-        assert "test.sync_decorated" in captured.err
+        assert "test.sync_decorated" in trace_log.buffer[-1].getMessage()
 
     @pytest.mark.asyncio
-    async def test_decorator_with_metadata(self, capsys):
+    async def test_decorator_with_metadata(self, trace_log, scan):
         """Test decorator accepts metadata kwargs"""
 
         @trace_span("test.with_metadata", component="api", version="1.0")
@@ -166,12 +203,8 @@ class TestTraceSpanDecorator:
 
         assert result == "done"
 
-        captured = capsys.readouterr()
-        output = captured.err
-        assert "component" in output
-        assert "api" in output
-        assert "version" in output
-        assert "1.0" in output
+        needles = {"component", "api", "version", "1.0"}
+        assert scan(trace_log.buffer[-1].getMessage(), needles) == needles
 
     @pytest.mark.asyncio
     async def test_decorator_propagates_exceptions(self):
@@ -200,7 +233,7 @@ class TestIntegration:
     """Integration tests showing full tracing workflow"""
 
     @pytest.mark.asyncio
-    async def test_distributed_trace_simulation(self, capsys):
+    async def test_distributed_trace_simulation(self, clock, trace_log, scan):
         """Test simulating distributed trace across multiple services"""
 
         # Service 1: Bot creates trace
@@ -210,7 +243,8 @@ class TestIntegration:
         async def bot_handler(message: str):
             span = TraceSpan("bot.call_api", trace_id)
             span.add_metadata("component", "teams_bot")
-            await asyncio.sleep(0.01)
+            clock.advance(0.01)
+            await asyncio.sleep(0)
             span.end()
             span.log()
             return trace_id  # Simulate sending via HTTP header
@@ -222,7 +256,8 @@ class TestIntegration:
             start_trace(received_trace_id)
             span = TraceSpan("orchestrator.process", received_trace_id)
             span.add_metadata("component", "orchestrator")
-            await asyncio.sleep(0.01)
+            clock.advance(0.01)
+            await asyncio.sleep(0)
             span.end()
             span.log()
             return "response"
@@ -233,14 +268,9 @@ class TestIntegration:
 
         assert response == "response"
 
-        # Verify both services logged with same trace_id (logging goes to stderr)
-        captured = capsys.readouterr()
-        output = captured.err
-        assert trace_id in output
-        assert "bot.call_api" in output
-        assert "orchestrator.process" in output
-        assert "teams_bot" in output
-        assert "orchestrator" in output
+        # Verify both services logged with same trace_id
+        needles = {trace_id, "bot.call_api", "orchestrator.process", "teams_bot", "orchestrator"}
+        assert scan(log_text(trace_log), needles) == needles
 
 
 if __name__ == "__main__":
@@ -0,0 +1,30 @@
+"""
+Shared fixtures for unit tests
+"""
+import pytest
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from spec_validator import SpecValidator
+
+
+@pytest.fixture(scope="session")
+def validator():
+    """
+    One SpecValidator for the whole session (one per worker under xdist)
+
+    SpecValidator is stateless, so one shared instance is safe across
+    every test module.
+    """
+    return SpecValidator()
+
+
+@pytest.fixture(scope="session")
+def bad_json_path(tmp_path_factory):
+    """A file holding malformed JSON, written once per session"""
+    path = tmp_path_factory.mktemp("bad_json") / "bad.json"
+    path.write_text("{invalid json")
+    return path
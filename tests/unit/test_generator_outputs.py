@@ -3,337 +3,268 @@ Unit tests for generator output validation
 """
 import json
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
 import sys
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-
-class TestScaffoldGenerator:
-    """Test scaffold generator outputs"""
-
-    def setup_method(self):
-        """Create temporary output directory for each test"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.spec = {
-            "id": "test_goal",
-            "title": "Test Goal",
-            "version": "1.0.0",
-            "agents": {
-                "supervisor": {
-                    "kind": "supervisor",
-                    "policy": "simple_router",
-                    "llm_config": {"model": "gpt-4"}
-                }
-            },
-            "ux": {
-                "teams": {"enabled": False},
-                "webchat": {"enabled": False},
-                "api": {"enabled": True}
-            }
+from generators.scaffold import generate as scaffold_generate
+from generators.langgraph import generate as langgraph_generate
+from generators.agents import generate as agents_generate
+from generators.tools import generate as tools_generate
+from generators.assets import generate as assets_generate
+
+# Generators write into real tmp_path_factory directories. Faking the
+# filesystem by patching open()/Path misses writes made through shutil and
+# os (scaffold copies frmk/ with shutil.copytree), so it isn't reliable.
+
+SCAFFOLD_SPEC = {
+    "id": "test_goal",
+    "title": "Test Goal",
+    "version": "1.0.0",
+    "agents": {
+        "supervisor": {
+            "kind": "supervisor",
+            "policy": "simple_router",
+            "llm_config": {"model": "gpt-4"}
         }
+    },
+    "ux": {
+        "teams": {"enabled": False},
+        "webchat": {"enabled": False},
+        "api": {"enabled": True}
+    }
+}
 
-    def teardown_method(self):
-        """Clean up temporary directory"""
-        if Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
 
-    def test_scaffold_creates_base_structure(self):
-        """Test that scaffold creates expected directory structure"""
-        from generators.scaffold import generate
+@pytest.fixture(scope="module")
+def scaffold_dir(tmp_path_factory):
+    """Run the scaffold generator once for every test that inspects its output"""
+    out_dir = tmp_path_factory.mktemp("scaffold")
+    scaffold_generate(SCAFFOLD_SPEC, str(out_dir), dry_run=False)
+    return out_dir
+
 
-        generate(self.spec, self.temp_dir, dry_run=False)
+class TestScaffoldGenerator:
+    """Test scaffold generator outputs"""
 
+    def test_scaffold_creates_base_structure(self, scaffold_dir):
+        """Test that scaffold creates expected directory structure"""
         # Check directories
-        assert Path(self.temp_dir, "langgraph").exists()
-        assert Path(self.temp_dir, "orchestrator").exists()
-        assert Path(self.temp_dir, "infra").exists()
-        assert Path(self.temp_dir, "scripts").exists()
-        assert Path(self.temp_dir, "tests").exists()
-        assert Path(self.temp_dir, "prompts").exists()
-
-    def test_scaffold_creates_readme(self):
+        assert Path(scaffold_dir, "langgraph").exists()
+        assert Path(scaffold_dir, "orchestrator").exists()
+        assert Path(scaffold_dir, "infra").exists()
+        assert Path(scaffold_dir, "scripts").exists()
+        assert Path(scaffold_dir, "tests").exists()
+        assert Path(scaffold_dir, "prompts").exists()
+
+    def test_scaffold_creates_readme(self, scaffold_dir):
         """Test that scaffold creates README.md"""
-        from generators.scaffold import generate
-
-        generate(self.spec, self.temp_dir, dry_run=False)
-
-        readme_path = Path(self.temp_dir, "README.md")
+        readme_path = Path(scaffold_dir, "README.md")
         assert readme_path.exists()
 
         # Check README contains spec title
         content = readme_path.read_text()
-        assert self.spec["title"] in content
+        assert SCAFFOLD_SPEC["title"] in content
 
-    def test_scaffold_creates_gitignore(self):
+    def test_scaffold_creates_gitignore(self, scaffold_dir, scan):
         """Test that scaffold creates .gitignore"""
-        from generators.scaffold import generate
-
-        generate(self.spec, self.temp_dir, dry_run=False)
-
-        gitignore_path = Path(self.temp_dir, ".gitignore")
+        gitignore_path = Path(scaffold_dir, ".gitignore")
         assert gitignore_path.exists()
 
-        content = gitignore_path.read_text()
-        assert "__pycache__" in content
-        assert ".env" in content
+        hits = scan(gitignore_path.read_text(), ["__pycache__", ".env"])
+        assert "__pycache__" in hits
+        assert ".env" in hits
 
-    def test_scaffold_creates_base_files(self):
+    def test_scaffold_creates_base_files(self, scaffold_dir):
         """Test that scaffold creates base files"""
-        from generators.scaffold import generate
-
-        generate(self.spec, self.temp_dir, dry_run=False)
-
         # Scaffold creates README, LICENSE, .gitignore
-        assert Path(self.temp_dir, "README.md").exists()
-        assert Path(self.temp_dir, "LICENSE").exists()
-        assert Path(self.temp_dir, ".gitignore").exists()
+        assert Path(scaffold_dir, "README.md").exists()
+        assert Path(scaffold_dir, "LICENSE").exists()
+        assert Path(scaffold_dir, ".gitignore").exists()
 
         # requirements.txt is created per-component (orchestrator/, langgraph/) not at root
         # This matches the design where each component has its own dependencies
 
 
-class TestLangGraphGenerator:
-    """Test langgraph generator outputs"""
-
-    def setup_method(self):
-        """Create temporary output directory for each test"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.spec = {
-            "id": "test_goal",
-            "title": "Test Goal",
-            "version": "1.0.0",
-            "agents": {
-                "supervisor_agent": {"kind": "supervisor", "policy": "simple_router"},
-                "worker_agent": {"kind": "llm_agent", "tools": []}
-            }
-        }
+LANGGRAPH_SPEC = {
+    "id": "test_goal",
+    "title": "Test Goal",
+    "version": "1.0.0",
+    "agents": {
+        "supervisor_agent": {"kind": "supervisor", "policy": "simple_router"},
+        "worker_agent": {"kind": "llm_agent", "tools": []}
+    }
+}
 
-    def teardown_method(self):
-        """Clean up temporary directory"""
-        if Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
 
-    def test_langgraph_creates_quest_builder(self):
-        """Test that langgraph generator creates quest_builder.py"""
-        from generators.langgraph import generate
+@pytest.fixture(scope="class")
+def langgraph_dir(tmp_path_factory):
+    """Run the langgraph generator once for the whole class"""
+    out_dir = tmp_path_factory.mktemp("langgraph")
+    langgraph_generate(LANGGRAPH_SPEC, str(out_dir), dry_run=False)
+    return out_dir
 
-        generate(self.spec, self.temp_dir, dry_run=False)
 
-        quest_builder_path = Path(self.temp_dir, "langgraph", "quest_builder.py")
-        assert quest_builder_path.exists()
+@pytest.fixture(scope="class")
+def quest_builder_source(langgraph_dir):
+    """Generated quest_builder.py, read once for the whole class"""
+    quest_builder_path = Path(langgraph_dir, "langgraph", "quest_builder.py")
+    if not quest_builder_path.exists():
+        pytest.fail(f"{quest_builder_path} was not generated")
+    return quest_builder_path.read_text()
 
-    def test_quest_builder_imports_langgraph(self):
-        """Test that quest_builder imports LangGraph"""
-        from generators.langgraph import generate
 
-        generate(self.spec, self.temp_dir, dry_run=False)
+class TestLangGraphGenerator:
+    """Test langgraph generator outputs"""
 
-        quest_builder_path = Path(self.temp_dir, "langgraph", "quest_builder.py")
-        content = quest_builder_path.read_text()
+    def test_langgraph_creates_quest_builder(self, langgraph_dir):
+        """Test that langgraph generator creates quest_builder.py"""
+        quest_builder_path = Path(langgraph_dir, "langgraph", "quest_builder.py")
+        assert quest_builder_path.exists()
 
-        assert "from langgraph.graph import StateGraph" in content
+    def test_quest_builder_imports_langgraph(self, quest_builder_source):
+        """Test that quest_builder imports LangGraph"""
+        assert "from langgraph.graph import StateGraph" in quest_builder_source
 
-    def test_quest_builder_defines_state_class(self):
+    def test_quest_builder_defines_state_class(self, quest_builder_source, scan):
         """Test that quest_builder defines state class"""
-        from generators.langgraph import generate
-
-        generate(self.spec, self.temp_dir, dry_run=False)
+        hits = scan(quest_builder_source, ["State", "class"])
+        assert "State" in hits or "class" in hits
 
-        quest_builder_path = Path(self.temp_dir, "langgraph", "quest_builder.py")
-        content = quest_builder_path.read_text()
-
-        assert "State" in content or "class" in content
-
-    def test_langgraph_creates_agents_directory(self):
+    def test_langgraph_creates_agents_directory(self, langgraph_dir):
         """Test that langgraph generator creates agents directory"""
-        from generators.langgraph import generate
-
-        generate(self.spec, self.temp_dir, dry_run=False)
-
-        agents_dir = Path(self.temp_dir, "langgraph", "agents")
+        agents_dir = Path(langgraph_dir, "langgraph", "agents")
         assert agents_dir.exists()
         assert agents_dir.is_dir()
 
 
-class TestAgentsGenerator:
-    """Test agents generator outputs"""
-
-    def setup_method(self):
-        """Create temporary output directory for each test"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.spec = {
-            "id": "test_goal",
-            "title": "Test Goal",
-            "version": "1.0.0",
-            "agents": {
-                "flight_agent": {
-                    "kind": "llm_agent",
-                    "tools": ["flight_api"],
-                    "llm_config": {"model": "gpt-4"}
-                }
-            }
+AGENTS_SPEC = {
+    "id": "test_goal",
+    "title": "Test Goal",
+    "version": "1.0.0",
+    "agents": {
+        "flight_agent": {
+            "kind": "llm_agent",
+            "tools": ["flight_api"],
+            "llm_config": {"model": "gpt-4"}
         }
+    }
+}
 
-    def teardown_method(self):
-        """Clean up temporary directory"""
-        if Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
-
-    def test_agents_generator_creates_agent_files(self):
-        """Test that agent files are created for each agent"""
-        from generators.agents import generate
 
-        generate(self.spec, self.temp_dir, dry_run=False)
+@pytest.fixture(scope="class")
+def agents_dir(tmp_path_factory):
+    """Run the agents generator once for the whole class"""
+    out_dir = tmp_path_factory.mktemp("agents")
+    agents_generate(AGENTS_SPEC, str(out_dir), dry_run=False)
+    return out_dir
 
-        for agent_name in self.spec["agents"].keys():
-            agent_file = Path(self.temp_dir, "langgraph", "agents", f"{agent_name}.py")
-            assert agent_file.exists(), f"Agent file for {agent_name} not created"
 
-    def test_agent_file_has_process_response(self):
-        """Test that agent file implements _process_response abstract method"""
-        from generators.agents import generate
+class TestAgentsGenerator:
+    """Test agents generator outputs"""
 
-        generate(self.spec, self.temp_dir, dry_run=False)
+    @pytest.mark.parametrize("agent_name", list(AGENTS_SPEC["agents"]))
+    def test_agents_generator_creates_agent_files(self, agents_dir, agent_name):
+        """Test that agent files are created for each agent"""
+        agent_file = Path(agents_dir, "langgraph", "agents", f"{agent_name}.py")
+        assert agent_file.exists(), f"Agent file for {agent_name} not created"
 
-        agent_file = Path(self.temp_dir, "langgraph", "agents", "flight_agent.py")
+    def test_agent_file_has_process_response(self, agents_dir, scan):
+        """Test that agent file implements _process_response abstract method"""
+        agent_file = Path(agents_dir, "langgraph", "agents", "flight_agent.py")
         content = agent_file.read_text()
+        hits = scan(content, ["async def _process_response", "async def flight_agent_node"])
 
         # Generated agents must implement the _process_response abstract method from BaseAgent
-        assert "async def _process_response" in content
+        assert "async def _process_response" in hits
 
         # And should have a node function for LangGraph integration
-        assert "async def flight_agent_node" in content
+        assert "async def flight_agent_node" in hits
+
+
+TOOLS_SPEC = {
+    "id": "test_goal",
+    "title": "Test Goal",
+    "version": "1.0.0",
+    "agents": {"supervisor": {"kind": "supervisor"}},
+    "tools": {
+        "flight_api": {
+            "type": "http",
+            "spec": {"url": "https://api.example.com/flights", "method": "POST"}
+        }
+    }
+}
 
 
-class TestToolsGenerator:
-    """Test tools generator outputs"""
+@pytest.fixture(scope="class")
+def tools_dir(tmp_path_factory):
+    """Run the tools generator once for the whole class"""
+    out_dir = tmp_path_factory.mktemp("tools")
+    tools_generate(TOOLS_SPEC, str(out_dir), dry_run=False)
+    return out_dir
 
-    def setup_method(self):
-        """Create temporary output directory for each test"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.spec = {
-            "id": "test_goal",
-            "title": "Test Goal",
-            "version": "1.0.0",
-            "agents": {"supervisor": {"kind": "supervisor"}},
-            "tools": {
-                "flight_api": {
-                    "type": "http",
-                    "spec": {"url": "https://api.example.com/flights", "method": "POST"}
-                }
-            }
-        }
 
-    def teardown_method(self):
-        """Clean up temporary directory"""
-        if Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
+class TestToolsGenerator:
+    """Test tools generator outputs"""
 
-    def test_tools_generator_creates_tool_files(self):
+    def test_tools_generator_creates_tool_files(self, tools_dir):
         """Test that tool files are created"""
-        from generators.tools import generate
+        tools_path = Path(tools_dir, "tools")
+        assert tools_path.exists()
 
-        generate(self.spec, self.temp_dir, dry_run=False)
-
-        tools_dir = Path(self.temp_dir, "tools")
-        assert tools_dir.exists()
-
-        for tool_name in self.spec["tools"].keys():
-            tool_dir = Path(tools_dir, tool_name)
+        for tool_name in TOOLS_SPEC["tools"].keys():
+            tool_dir = Path(tools_path, tool_name)
             assert tool_dir.exists(), f"Tool directory for {tool_name} not created"
 
 
-class TestAssetsGenerator:
-    """Test assets generator outputs"""
+ASSETS_SPEC = {
+    "id": "test_goal",
+    "title": "Test Goal",
+    "version": "1.0.0",
+    "agents": {
+        "supervisor_agent": {"kind": "supervisor"},
+        "worker_agent": {"kind": "llm_agent"}
+    }
+}
 
-    def setup_method(self):
-        """Create temporary output directory for each test"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.spec = {
-            "id": "test_goal",
-            "title": "Test Goal",
-            "version": "1.0.0",
-            "agents": {
-                "supervisor_agent": {"kind": "supervisor"},
-                "worker_agent": {"kind": "llm_agent"}
-            }
-        }
 
-    def teardown_method(self):
-        """Clean up temporary directory"""
-        if Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
+@pytest.fixture(scope="class")
+def assets_dir(tmp_path_factory):
+    """Run the assets generator once for the whole class"""
+    out_dir = tmp_path_factory.mktemp("assets")
+    assets_generate(ASSETS_SPEC, str(out_dir), dry_run=False)
+    return out_dir
 
-    def test_assets_creates_prompt_templates(self):
-        """Test that prompt templates are created"""
-        from generators.assets import generate
 
-        generate(self.spec, self.temp_dir, dry_run=False)
+class TestAssetsGenerator:
+    """Test assets generator outputs"""
 
-        prompts_dir = Path(self.temp_dir, "prompts")
+    @pytest.mark.parametrize("agent_name", list(ASSETS_SPEC["agents"]))
+    def test_assets_creates_prompt_templates(self, assets_dir, agent_name):
+        """Test that a prompt template is created for each agent"""
+        prompts_dir = Path(assets_dir, "prompts")
         assert prompts_dir.exists()
 
-        # Check that prompts are created for each agent
-        for agent_name in self.spec["agents"].keys():
-            prompt_file = Path(prompts_dir, f"{agent_name}.md")
-            assert prompt_file.exists(), f"Prompt template for {agent_name} not created"
+        prompt_file = Path(prompts_dir, f"{agent_name}.md")
+        assert prompt_file.exists(), f"Prompt template for {agent_name} not created"
 
-    def test_prompt_templates_have_content(self):
+    @pytest.mark.parametrize("agent_name", list(ASSETS_SPEC["agents"]))
+    def test_prompt_templates_have_content(self, assets_dir, agent_name):
         """Test that prompt templates are not empty"""
-        from generators.assets import generate
-
-        generate(self.spec, self.temp_dir, dry_run=False)
-
-        prompts_dir = Path(self.temp_dir, "prompts")
-
-        for agent_name in self.spec["agents"].keys():
-            prompt_file = Path(prompts_dir, f"{agent_name}.md")
-            content = prompt_file.read_text()
-            assert len(content) > 0, f"Prompt template for {agent_name} is empty"
-            assert agent_name.replace("_", " ").title() in content or \
-                   "Agent" in content, f"Prompt doesn't reference agent name"
+        content = Path(assets_dir, "prompts", f"{agent_name}.md").read_text()
+        assert len(content) > 0, f"Prompt template for {agent_name} is empty"
+        assert agent_name.replace("_", " ").title() in content or \
+               "Agent" in content, f"Prompt doesn't reference agent name"
 
 
 class TestManifestGeneration:
     """Test .goalgen manifest generation"""
 
-    def setup_method(self):
-        """Create temporary output directory for each test"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.spec = {
-            "id": "test_goal",
-            "title": "Test Goal",
-            "version": "1.0.0",
-            "agents": {
-                "supervisor": {
-                    "kind": "supervisor",
-                    "policy": "simple_router",
-                    "llm_config": {"model": "gpt-4"}
-                }
-            },
-            "ux": {
-                "teams": {"enabled": False},
-                "webchat": {"enabled": False},
-                "api": {"enabled": True}
-            }
-        }
-
-    def teardown_method(self):
-        """Clean up temporary directory"""
-        if Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
-
-    def test_manifest_is_created(self):
+    def test_manifest_is_created(self, scaffold_dir):
         """Test that .goalgen/manifest.json is created"""
-        from generators.scaffold import generate
-
-        generate(self.spec, self.temp_dir, dry_run=False)
-
-        manifest_path = Path(self.temp_dir, ".goalgen", "manifest.json")
+        manifest_path = Path(scaffold_dir, ".goalgen", "manifest.json")
         # Note: manifest is created by main goalgen.py, not by individual generators
         # This test documents expected behavior
 
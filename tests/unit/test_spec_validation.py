@@ -1,149 +1,91 @@
 """
 Unit tests for goal spec validation
 """
-import json
 import pytest
-from pathlib import Path
 
 
 class TestSpecValidation:
     """Test goal spec validation logic"""
 
-    def test_valid_spec_loads_successfully(self):
+    def test_valid_spec_loads_successfully(self, example_spec):
         """Test that a valid spec loads without errors"""
-        spec_path = Path(__file__).parent.parent.parent / "examples" / "travel_planning.json"
-
-        with open(spec_path) as f:
-            spec = json.load(f)
-
         # Basic structure validation
-        assert "id" in spec
-        assert "title" in spec
-        assert "agents" in spec
-        assert len(spec["agents"]) > 0
+        assert "id" in example_spec
+        assert "title" in example_spec
+        assert "agents" in example_spec
+        assert len(example_spec["agents"]) > 0
 
-    def test_spec_has_required_fields(self):
+    def test_spec_has_required_fields(self, example_spec):
         """Test that spec contains all required fields"""
-        spec_path = Path(__file__).parent.parent.parent / "examples" / "travel_planning.json"
-
-        with open(spec_path) as f:
-            spec = json.load(f)
-
         required_fields = ["id", "title", "version", "agents"]
         for field in required_fields:
-            assert field in spec, f"Missing required field: {field}"
+            assert field in example_spec, f"Missing required field: {field}"
 
-    def test_spec_id_is_valid_identifier(self):
+    def test_spec_id_is_valid_identifier(self, example_spec):
         """Test that spec id is a valid Python/file identifier"""
-        spec_path = Path(__file__).parent.parent.parent / "examples" / "travel_planning.json"
-
-        with open(spec_path) as f:
-            spec = json.load(f)
-
-        spec_id = spec["id"]
+        spec_id = example_spec["id"]
         assert spec_id.replace("_", "").isalnum(), f"Spec id '{spec_id}' contains invalid characters"
         assert not spec_id[0].isdigit(), f"Spec id '{spec_id}' starts with a digit"
 
-    def test_agents_section_is_dict(self):
+    def test_agents_section_is_dict(self, example_spec):
         """Test that agents section is a dictionary"""
-        spec_path = Path(__file__).parent.parent.parent / "examples" / "travel_planning.json"
+        assert isinstance(example_spec["agents"], dict), "agents must be a dictionary"
+        assert len(example_spec["agents"]) > 0, "agents dictionary cannot be empty"
 
-        with open(spec_path) as f:
-            spec = json.load(f)
-
-        assert isinstance(spec["agents"], dict), "agents must be a dictionary"
-        assert len(spec["agents"]) > 0, "agents dictionary cannot be empty"
-
-    def test_each_agent_has_kind(self):
+    def test_each_agent_has_kind(self, example_spec):
         """Test that each agent has a 'kind' field"""
-        spec_path = Path(__file__).parent.parent.parent / "examples" / "travel_planning.json"
-
-        with open(spec_path) as f:
-            spec = json.load(f)
-
-        for agent_name, agent_config in spec["agents"].items():
+        for agent_name, agent_config in example_spec["agents"].items():
             assert "kind" in agent_config, f"Agent '{agent_name}' missing 'kind' field"
             assert agent_config["kind"] in ["supervisor", "llm_agent", "evaluator"], \
                 f"Agent '{agent_name}' has invalid kind: {agent_config['kind']}"
 
-    def test_supervisor_agent_exists(self):
+    def test_supervisor_agent_exists(self, example_spec):
         """Test that at least one supervisor agent exists"""
-        spec_path = Path(__file__).parent.parent.parent / "examples" / "travel_planning.json"
-
-        with open(spec_path) as f:
-            spec = json.load(f)
-
         has_supervisor = any(
             agent_config.get("kind") == "supervisor"
-            for agent_config in spec["agents"].values()
+            for agent_config in example_spec["agents"].values()
         )
         assert has_supervisor, "Spec must have at least one supervisor agent"
 
-    def test_tools_referenced_by_agents_are_defined(self):
+    def test_tools_referenced_by_agents_are_defined(self, example_spec):
         """Test that all tools referenced by agents are defined in tools section"""
-        spec_path = Path(__file__).parent.parent.parent / "examples" / "travel_planning.json"
+        defined_tools = example_spec.get("tools", {})
 
-        with open(spec_path) as f:
-            spec = json.load(f)
+        for agent_name, agent_config in example_spec["agents"].items():
+            undefined = [
+                tool for tool in agent_config.get("tools", []) if tool not in defined_tools
+            ]
+            assert not undefined, \
+                f"Agent '{agent_name}' references undefined tools {undefined}"
 
-        defined_tools = set(spec.get("tools", {}).keys())
-
-        for agent_name, agent_config in spec["agents"].items():
-            agent_tools = agent_config.get("tools", [])
-            for tool in agent_tools:
-                assert tool in defined_tools, \
-                    f"Agent '{agent_name}' references undefined tool '{tool}'"
-
-    def test_http_tools_have_required_fields(self):
+    def test_http_tools_have_required_fields(self, example_spec):
         """Test that HTTP tools have url and method"""
-        spec_path = Path(__file__).parent.parent.parent / "examples" / "travel_planning.json"
-
-        with open(spec_path) as f:
-            spec = json.load(f)
-
-        for tool_name, tool_config in spec.get("tools", {}).items():
+        for tool_name, tool_config in example_spec.get("tools", {}).items():
             if tool_config.get("type") == "http":
                 assert "spec" in tool_config, f"HTTP tool '{tool_name}' missing spec"
                 assert "url" in tool_config["spec"], f"HTTP tool '{tool_name}' missing url"
                 assert "method" in tool_config["spec"], f"HTTP tool '{tool_name}' missing method"
 
-    def test_version_is_semantic(self):
+    def test_version_is_semantic(self, example_spec):
         """Test that version follows semantic versioning"""
-        spec_path = Path(__file__).parent.parent.parent / "examples" / "travel_planning.json"
-
-        with open(spec_path) as f:
-            spec = json.load(f)
-
-        version = spec["version"]
+        version = example_spec["version"]
         parts = version.split(".")
         assert len(parts) == 3, f"Version '{version}' is not semantic (x.y.z)"
         for part in parts:
             assert part.isdigit(), f"Version part '{part}' is not numeric"
 
-    def test_tasks_reference_valid_agents(self):
+    def test_tasks_reference_valid_agents(self, example_spec):
         """Test that tasks reference agents that exist"""
-        spec_path = Path(__file__).parent.parent.parent / "examples" / "travel_planning.json"
-
-        with open(spec_path) as f:
-            spec = json.load(f)
-
-        defined_agents = set(spec["agents"].keys())
-
-        for task in spec.get("tasks", []):
+        for task in example_spec.get("tasks", []):
             if "agent" in task:
-                assert task["agent"] in defined_agents, \
+                assert task["agent"] in example_spec["agents"], \
                     f"Task '{task['id']}' references undefined agent '{task['agent']}'"
 
-    def test_llm_config_has_valid_model(self):
+    def test_llm_config_has_valid_model(self, example_spec):
         """Test that LLM configs specify valid models"""
-        spec_path = Path(__file__).parent.parent.parent / "examples" / "travel_planning.json"
-
-        with open(spec_path) as f:
-            spec = json.load(f)
-
         valid_models = ["gpt-4", "gpt-4-turbo", "gpt-3.5-turbo", "gpt-4o", "gpt-4o-mini"]
 
-        for agent_name, agent_config in spec["agents"].items():
+        for agent_name, agent_config in example_spec["agents"].items():
             if "llm_config" in agent_config:
                 model = agent_config["llm_config"].get("model")
                 if model:
@@ -203,7 +145,7 @@ class TestSpecInvalidCases:
         }
 
         agent_tools = invalid_spec["agents"]["test_agent"]["tools"]
-        defined_tools = set(invalid_spec["tools"].keys())
+        defined_tools = invalid_spec["tools"]
 
         has_undefined = any(tool not in defined_tools for tool in agent_tools)
         assert has_undefined
@@ -0,0 +1,79 @@
+"""
+Unit tests for template engine case filters
+"""
+import pytest
+
+from template_engine import TemplateEngine, _CASE_SCAN_MAX_LEN, _case_scan
+
+# Long enough to take the regex path in snake_case/kebab_case
+LONG_NAME = "QuestBuilderAgentWithAVeryLongDescriptiveNameForHTTPServerRequests v2"
+
+CASE_INPUTS = [
+    "HTTPServer",
+    "userId",
+    "getHTTPResponseCode",
+    "version2Beta",
+    "flight_agent",
+    "a Bc",
+    "a\nBc",
+    "a-_b",
+    "Travel Planning-Goal",
+    LONG_NAME,
+]
+
+
+class TestCaseFilters:
+    """Test snake_case, kebab_case and upper_case"""
+
+    def test_long_name_takes_regex_path(self):
+        """Test that LONG_NAME is past the single-pass scanner's limit"""
+        assert len(LONG_NAME) >= _CASE_SCAN_MAX_LEN
+
+    @pytest.mark.parametrize("text,expected", [
+        ("HTTPServer", "http_server"),
+        ("getHTTPResponseCode", "get_http_response_code"),
+        ("version2Beta", "version2_beta"),
+        ("flight_agent", "flight_agent"),
+        ("a Bc", "a__bc"),
+        ("a\nBc", "a_bc"),
+        ("a-_b", "a__b"),
+        (LONG_NAME,
+         "quest_builder_agent_with_a_very_long_descriptive_name_for_http_server_requests_v2"),
+    ])
+    def test_snake_case(self, text, expected):
+        """Test snake_case on known inputs"""
+        assert TemplateEngine.snake_case(text) == expected
+
+    @pytest.mark.parametrize("text,expected", [
+        ("HTTPServer", "http-server"),
+        ("userId", "user-id"),
+        ("a Bc", "a--bc"),
+        ("a\nBc", "a-bc"),
+        ("a-_b", "a--b"),
+        (LONG_NAME,
+         "quest-builder-agent-with-a-very-long-descriptive-name-for-http-server-requests-v2"),
+    ])
+    def test_kebab_case(self, text, expected):
+        """Test kebab_case on known inputs"""
+        assert TemplateEngine.kebab_case(text) == expected
+
+    @pytest.mark.parametrize("text,expected", [
+        ("flight_agent", "FLIGHT_AGENT"),
+        ("HTTPServer", "HTTP_SERVER"),
+        ("a Bc", "A__BC"),
+        (LONG_NAME,
+         "QUEST_BUILDER_AGENT_WITH_A_VERY_LONG_DESCRIPTIVE_NAME_FOR_HTTP_SERVER_REQUESTS_V2"),
+    ])
+    def test_upper_case(self, text, expected):
+        """Test upper_case on known inputs"""
+        assert TemplateEngine.upper_case(text) == expected
+
+    @pytest.mark.parametrize("text", CASE_INPUTS)
+    def test_scanner_matches_regex_path(self, text):
+        """Test that the single-pass scanner agrees with the regex path"""
+        # Repeat the input until it is long enough to take the regex path
+        long_text = " ".join([text] * (_CASE_SCAN_MAX_LEN // len(text) + 1))
+        assert len(long_text) >= _CASE_SCAN_MAX_LEN
+
+        assert _case_scan(long_text, "_", "-") == TemplateEngine.snake_case(long_text)
+        assert _case_scan(long_text, "-", "_") == TemplateEngine.kebab_case(long_text)